@@ -1,4 +1,5 @@
 import dataclasses
+import functools
 import logging
 import os
 import re
@@ -31,6 +32,18 @@ Dataclass = type[DataclassInstance]
 ResultFn = Callable[[], Iterable[Result]]
 
 
+@functools.cache
+def _cached_fields(klass: Dataclass) -> tuple[dataclasses.Field[Any], ...]:
+    """Get the fields of a dataclass, introspecting every class only once."""
+    return dataclasses.fields(klass)
+
+
+@functools.cache
+def _field_names(klass: Dataclass) -> tuple[str, ...]:
+    """Get the field names of a dataclass, in declaration order."""
+    return tuple(f.name for f in _cached_fields(klass))
+
+
 class SqlBackend(ABC):
     """Abstract base class for SQL backends.
 
@@ -66,7 +79,7 @@ class SqlBackend(ABC):
     @classmethod
     def _schema_for(cls, klass: Dataclass):
         fields = []
-        for f in dataclasses.fields(klass):
+        for f in _cached_fields(klass):
             field_type = f.type
             if isinstance(field_type, UnionType):
                 field_type = field_type.__args__[0]
@@ -86,13 +99,14 @@ class SqlBackend(ABC):
             return rows
 
         results = []
-        class_fields = dataclasses.fields(klass)
+        class_fields = _cached_fields(klass)
         for row in rows:
             if row is None:
                 continue
             for field in class_fields:
                 if not hasattr(row, field.name):
-                    logger.debug(f"Field {field.name} not present in row {dataclasses.asdict(row)}")
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(f"Field {field.name} not present in row {dataclasses.asdict(row)}")
                     continue
                 if field.default is not None and getattr(row, field.name) is None:
                     msg = f"Not null constraint violated for column {field.name}, row = {dataclasses.asdict(row)}"
@@ -138,11 +152,13 @@ class StatementExecutionBackend(SqlBackend):
         self._debug_truncate_bytes = debug_truncate_bytes if isinstance(debug_truncate_bytes, int) else 96
 
     def execute(self, sql: str, *, catalog: str | None = None, schema: str | None = None) -> None:
-        logger.debug(f"[api][execute] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[api][execute] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
         self._sql.execute(sql, catalog=catalog, schema=schema)
 
     def fetch(self, sql: str, *, catalog: str | None = None, schema: str | None = None) -> Iterator[Row]:
-        logger.debug(f"[api][fetch] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[api][fetch] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
         return self._sql.fetch_all(sql, catalog=catalog, schema=schema)
 
     def save_table(self, full_name: str, rows: Sequence[DataclassInstance], klass: Dataclass, mode="append"):
@@ -150,8 +166,8 @@ class StatementExecutionBackend(SqlBackend):
         self.create_table(full_name, klass)
         if len(rows) == 0:
             return
-        fields = dataclasses.fields(klass)
-        field_names = [f.name for f in fields]
+        fields = _cached_fields(klass)
+        field_names = _field_names(klass)
         if mode == "overwrite":
             self.execute(f"TRUNCATE TABLE {full_name}")
         for i in range(0, len(rows), self._max_records_per_batch):
@@ -160,26 +176,28 @@ class StatementExecutionBackend(SqlBackend):
             sql = f'INSERT INTO {full_name} ({", ".join(field_names)}) VALUES ({vals})'
             self.execute(sql)
 
-    @staticmethod
-    def _row_to_sql(row: DataclassInstance, fields: tuple[dataclasses.Field[Any], ...]):
+    _value_to_sql: ClassVar[dict[type, Callable[[Any], str]]] = {
+        bool: lambda value: "TRUE" if value else "FALSE",
+        str: lambda value: "'" + str(value).replace("'", "''") + "'",
+        int: lambda value: f"{value}",
+    }
+
+    @classmethod
+    def _row_to_sql(cls, row: DataclassInstance, fields: tuple[dataclasses.Field[Any], ...]):
         data = []
         for f in fields:
             value = getattr(row, f.name)
+            if value is None:
+                data.append("NULL")
+                continue
             field_type = f.type
             if isinstance(field_type, UnionType):
                 field_type = field_type.__args__[0]
-            if value is None:
-                data.append("NULL")
-            elif field_type == bool:
-                data.append("TRUE" if value else "FALSE")
-            elif field_type == str:
-                value = str(value).replace("'", "''")
-                data.append(f"'{value}'")
-            elif field_type == int:
-                data.append(f"{value}")
-            else:
+            to_sql = cls._value_to_sql.get(field_type) if isinstance(field_type, type) else None
+            if to_sql is None:
                 msg = f"unknown type: {field_type}"
                 raise ValueError(msg)
+            data.append(to_sql(value))
         return ", ".join(data)
 
 
@@ -189,7 +207,8 @@ class _SparkBackend(SqlBackend):
         self._debug_truncate_bytes = debug_truncate_bytes if debug_truncate_bytes is not None else 96
 
     def execute(self, sql: str, *, catalog: str | None = None, schema: str | None = None) -> None:
-        logger.debug(f"[spark][execute] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[spark][execute] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
         try:
             if catalog:
                 self._spark.sql(f"USE CATALOG {catalog}")
@@ -201,7 +220,8 @@ class _SparkBackend(SqlBackend):
             raise self._api_error_from_message(error_message) from None
 
     def fetch(self, sql: str, *, catalog: str | None = None, schema: str | None = None) -> Iterator[Row]:
-        logger.debug(f"[spark][fetch] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"[spark][fetch] {self._only_n_bytes(sql, self._debug_truncate_bytes)}")
         try:
             if catalog:
                 self._spark.sql(f"USE CATALOG {catalog}")
@@ -335,4 +355,4 @@ class MockBackend(SqlBackend):
 
     @staticmethod
     def _row_factory(klass: Dataclass) -> type:
-        return Row.factory([f.name for f in dataclasses.fields(klass)])
+        return Row.factory(list(_field_names(klass)))
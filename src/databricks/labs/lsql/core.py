@@ -1,14 +1,16 @@
 import base64
 import datetime
+import functools
 import json
 import logging
 import random
+import re
 import threading
 import time
 import types
 from collections.abc import Callable, Iterator
 from datetime import timedelta
-from typing import Any
+from typing import Any, ClassVar
 
 import requests
 import sqlglot
@@ -34,6 +36,35 @@ MIN_PLATFORM_TIMEOUT = 5
 
 logger = logging.getLogger(__name__)
 
+# sqlglot resolves dialect names on every parse() and sql() call, so we keep a single instance around.
+# When sqlglot is installed with the [rs] extra, parsing goes through the native Rust tokenizer.
+_DATABRICKS = sqlglot.dialects.Databricks()
+
+# statements like SHOW, DESCRIBE, INSERT, or CREATE never get LIMIT 1, so there's no need to parse them
+_NOT_A_QUERY = re.compile(r"^\s*(?!(?:select|with|from)\b)[a-z]", re.IGNORECASE)
+
+try:
+    # orjson is an optional extra: we keep the dependency set small, but use it when it's available
+    import orjson  # type: ignore[import-not-found,unused-ignore]
+
+    # orjson silently turns integers that don't fit into 64 bits into floats, so we leave long numbers,
+    # like DECIMAL(38,0) values, to stdlib, which keeps them exact
+    _LONG_NUMBER = re.compile(r"\d{19,}")
+
+    def _json_loads(value: str) -> Any:
+        if _LONG_NUMBER.search(value):
+            return json.loads(value)
+        try:
+            return orjson.loads(value)  # pylint: disable=no-member
+        except ValueError:
+            # orjson is strict about NaN and Infinity, which stdlib accepts
+            return json.loads(value)
+
+except ImportError:
+
+    def _json_loads(value: str) -> Any:
+        return json.loads(value)
+
 
 class Row(tuple):
     """Row is a tuple with named fields that resembles PySpark's SQL Row API."""
@@ -152,7 +183,7 @@ class StatementExecutionExt:
         self._byte_limit = byte_limit
         self._disposition = disposition
         self._type_converters: dict[ColumnInfoTypeName, Callable[[str], Any]] = {
-            ColumnInfoTypeName.ARRAY: json.loads,
+            ColumnInfoTypeName.ARRAY: _json_loads,
             ColumnInfoTypeName.BINARY: base64.b64decode,
             ColumnInfoTypeName.BOOLEAN: lambda value: value.lower() == "true",
             ColumnInfoTypeName.CHAR: str,
@@ -161,11 +192,11 @@ class StatementExecutionExt:
             ColumnInfoTypeName.FLOAT: float,
             ColumnInfoTypeName.INT: int,
             ColumnInfoTypeName.LONG: int,
-            ColumnInfoTypeName.MAP: json.loads,
+            ColumnInfoTypeName.MAP: _json_loads,
             ColumnInfoTypeName.NULL: lambda _: None,
             ColumnInfoTypeName.SHORT: int,
             ColumnInfoTypeName.STRING: str,
-            ColumnInfoTypeName.STRUCT: json.loads,
+            ColumnInfoTypeName.STRUCT: _json_loads,
             ColumnInfoTypeName.TIMESTAMP: self._parse_timestamp,
         }
 
@@ -435,10 +466,31 @@ class StatementExecutionExt:
         # make it work with Python 3.7 to 3.10 as well
         return datetime.datetime.fromisoformat(value.replace("Z", "+00:00"))
 
-    @staticmethod
-    def _raise_if_needed(status: StatementStatus):
+    _failed_states: ClassVar[frozenset[StatementState]] = frozenset(
+        [StatementState.FAILED, StatementState.CANCELED, StatementState.CLOSED]
+    )
+
+    _error_classes: ClassVar[dict[ServiceErrorCode, type[errors.DatabricksError]]] = {
+        ServiceErrorCode.ABORTED: errors.Aborted,
+        ServiceErrorCode.ALREADY_EXISTS: errors.AlreadyExists,
+        ServiceErrorCode.BAD_REQUEST: errors.BadRequest,
+        ServiceErrorCode.CANCELLED: errors.Cancelled,
+        ServiceErrorCode.DEADLINE_EXCEEDED: errors.DeadlineExceeded,
+        ServiceErrorCode.INTERNAL_ERROR: errors.InternalError,
+        ServiceErrorCode.IO_ERROR: errors.InternalError,
+        ServiceErrorCode.NOT_FOUND: errors.NotFound,
+        ServiceErrorCode.RESOURCE_EXHAUSTED: errors.ResourceExhausted,
+        ServiceErrorCode.SERVICE_UNDER_MAINTENANCE: errors.TemporarilyUnavailable,
+        ServiceErrorCode.TEMPORARILY_UNAVAILABLE: errors.TemporarilyUnavailable,
+        ServiceErrorCode.UNAUTHENTICATED: errors.Unauthenticated,
+        ServiceErrorCode.UNKNOWN: errors.Unknown,
+        ServiceErrorCode.WORKSPACE_TEMPORARILY_UNAVAILABLE: errors.TemporarilyUnavailable,
+    }
+
+    @classmethod
+    def _raise_if_needed(cls, status: StatementStatus):
         """Raise an exception if the statement status is failed, canceled, or closed."""
-        if status.state not in [StatementState.FAILED, StatementState.CANCELED, StatementState.CLOSED]:
+        if status.state not in cls._failed_states:
             return
         status_error = status.error
         if status_error is None:
@@ -456,28 +508,14 @@ class StatementExecutionExt:
             raise NotFound(error_message)
         if "DELTA_MISSING_TRANSACTION_LOG" in error_message:
             raise DataLoss(error_message)
-        mapping = {
-            ServiceErrorCode.ABORTED: errors.Aborted,
-            ServiceErrorCode.ALREADY_EXISTS: errors.AlreadyExists,
-            ServiceErrorCode.BAD_REQUEST: errors.BadRequest,
-            ServiceErrorCode.CANCELLED: errors.Cancelled,
-            ServiceErrorCode.DEADLINE_EXCEEDED: errors.DeadlineExceeded,
-            ServiceErrorCode.INTERNAL_ERROR: errors.InternalError,
-            ServiceErrorCode.IO_ERROR: errors.InternalError,
-            ServiceErrorCode.NOT_FOUND: errors.NotFound,
-            ServiceErrorCode.RESOURCE_EXHAUSTED: errors.ResourceExhausted,
-            ServiceErrorCode.SERVICE_UNDER_MAINTENANCE: errors.TemporarilyUnavailable,
-            ServiceErrorCode.TEMPORARILY_UNAVAILABLE: errors.TemporarilyUnavailable,
-            ServiceErrorCode.UNAUTHENTICATED: errors.Unauthenticated,
-            ServiceErrorCode.UNKNOWN: errors.Unknown,
-            ServiceErrorCode.WORKSPACE_TEMPORARILY_UNAVAILABLE: errors.TemporarilyUnavailable,
-        }
         error_code = status_error.error_code
         if error_code is None:
             error_code = ServiceErrorCode.UNKNOWN
-        error_class = mapping.get(error_code, errors.Unknown)
+        error_class = cls._error_classes.get(error_code, errors.Unknown)
         raise error_class(error_message)
 
+    _deleted_warehouse_states: ClassVar[frozenset[State]] = frozenset([State.DELETED, State.DELETING])
+
     def _default_warehouse(self) -> str:
         """Get the default warehouse id from the workspace client configuration
         or DATABRICKS_WAREHOUSE_ID environment variable. If not set, it will use
@@ -492,7 +530,7 @@ class StatementExecutionExt:
             ids = []
             for v in self._ws.warehouses.list():
                 assert v.id is not None
-                if v.state in [State.DELETED, State.DELETING]:
+                if v.state in self._deleted_warehouse_states:
                     continue
                 if v.state == State.RUNNING:
                     self._ws.config.warehouse_id = v.id
@@ -509,9 +547,15 @@ class StatementExecutionExt:
             )
 
     @staticmethod
+    @functools.lru_cache(maxsize=512)
     def _add_limit(statement: str) -> str:
-        """Add a limit 1 to the statement if it does not have one already."""
-        statements = sqlglot.parse(statement, read="databricks")
+        """Add a limit 1 to the statement if it does not have one already.
+
+        The result only depends on the statement text, so it is memoized to skip re-parsing
+        the same statements, which is common for :py:meth:`fetch_one` calls in a loop."""
+        if _NOT_A_QUERY.match(statement):
+            return statement
+        statements = sqlglot.parse(statement, read=_DATABRICKS)
         if not statements:
             raise ValueError(f"cannot parse statement: {statement}")
         statement_ast = statements[0]
@@ -520,5 +564,5 @@ class StatementExecutionExt:
                 limit = statement_ast.args.get("limit", None)
                 if limit and limit.text("expression") != "1":
                     raise ValueError(f"limit is not 1: {limit.text('expression')}")
-            return statement_ast.limit(expression=1).sql("databricks")
+            return statement_ast.limit(expression=1).sql(_DATABRICKS)
         return statement
@@ -1,3 +1,4 @@
+import enum
 import os
 import sys
 from dataclasses import dataclass
@@ -47,6 +48,17 @@ class Baz:
     second: str | None = None
 
 
+class Priority(enum.IntEnum):
+    LOW = 1
+    HIGH = 2
+
+
+@dataclass
+class Task:
+    first: str
+    priority: int
+
+
 @dataclass
 class Bar:
     first: str
@@ -219,6 +231,29 @@ def test_statement_execution_backend_save_table_two_records():
     )
 
 
+def test_statement_execution_backend_save_table_int_enum():
+    ws = create_autospec(WorkspaceClient)
+
+    ws.statement_execution.execute_statement.return_value = ExecuteStatementResponse(
+        status=StatementStatus(state=StatementState.SUCCEEDED)
+    )
+
+    seb = StatementExecutionBackend(ws, "abc")
+
+    seb.save_table("a.b.c", [Task("it's", Priority.HIGH)], Task)
+
+    ws.statement_execution.execute_statement.assert_called_with(
+        warehouse_id="abc",
+        statement="INSERT INTO a.b.c (first, priority) VALUES ('it''s', 2)",
+        catalog=None,
+        schema=None,
+        disposition=None,
+        format=Format.JSON_ARRAY,
+        byte_limit=None,
+        wait_timeout=None,
+    )
+
+
 def test_statement_execution_backend_save_table_in_batches_of_two(mocker):
     ws = create_autospec(WorkspaceClient)
 
@@ -408,6 +443,30 @@ def test_mock_backend_save_table():
     ]
 
 
+@dataclass
+class Inner:
+    a: int
+
+
+@dataclass
+class Outer:
+    name: str
+    inner: Inner
+    tags: list[str]
+
+
+def test_mock_backend_save_table_records_snapshots():
+    mock_backend = MockBackend()
+    tags = ["x"]
+
+    mock_backend.save_table("a.b.c", [Outer("n", Inner(1), tags)], Outer)
+    tags.append("mutated")
+
+    assert mock_backend.rows_written_for("a.b.c", "append") == [
+        Row(name="n", inner=(1,), tags=["x"]),
+    ]
+
+
 def test_mock_backend_rows_dsl():
     rows = MockBackend.rows("foo", "bar")[
         [1, 2],
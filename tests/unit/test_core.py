@@ -1,8 +1,10 @@
 import datetime
+import math
 from unittest.mock import create_autospec
 
 import pytest
 import requests
+import sqlglot
 from databricks.sdk import WorkspaceClient, errors
 from databricks.sdk.service.sql import (
     ColumnInfo,
@@ -479,3 +481,81 @@ def test_callable_returns_iterator():
 
     assert len(rows) == 3
     assert rows == [Row(id=4), Row(id=5), Row(id=6)]
+
+
+def test_fetch_one_reuses_parsed_statement(mocker):
+    ws = create_autospec(WorkspaceClient)
+
+    ws.statement_execution.execute_statement.return_value = ExecuteStatementResponse(
+        status=StatementStatus(state=StatementState.SUCCEEDED),
+        manifest=ResultManifest(schema=ResultSchema(columns=[ColumnInfo(name="id", type_name=ColumnInfoTypeName.INT)])),
+        result=ResultData(data_array=[["4"]]),
+        statement_id="bcd",
+    )
+
+    see = StatementExecutionExt(ws, warehouse_id="abc")
+
+    StatementExecutionExt._add_limit.cache_clear()
+    parse = mocker.patch("sqlglot.parse", wraps=sqlglot.parse)
+    for _ in range(3):
+        see.fetch_one("SELECT 3+3 AS id")
+
+    parse.assert_called_once()
+    ws.statement_execution.execute_statement.assert_called_with(
+        warehouse_id="abc",
+        statement="SELECT 3 + 3 AS id LIMIT 1",
+        format=Format.JSON_ARRAY,
+        disposition=None,
+        byte_limit=None,
+        catalog=None,
+        schema=None,
+        wait_timeout=None,
+    )
+
+
+def test_fetch_all_complex_types():
+    ws = create_autospec(WorkspaceClient)
+
+    ws.statement_execution.execute_statement.return_value = ExecuteStatementResponse(
+        status=StatementStatus(state=StatementState.SUCCEEDED),
+        manifest=ResultManifest(
+            schema=ResultSchema(
+                columns=[
+                    ColumnInfo(name="tags", type_name=ColumnInfoTypeName.ARRAY),
+                    ColumnInfo(name="props", type_name=ColumnInfoTypeName.MAP),
+                    ColumnInfo(name="scores", type_name=ColumnInfoTypeName.ARRAY),
+                    ColumnInfo(name="ids", type_name=ColumnInfoTypeName.ARRAY),
+                ]
+            )
+        ),
+        result=ResultData(
+            data_array=[['["a","b"]', '{"x":"1"}', "[1.5,NaN]", "[18446744073709551616,-9223372036854775809,1]"]]
+        ),
+        statement_id="bcd",
+    )
+
+    see = StatementExecutionExt(ws, warehouse_id="abc")
+
+    rows = list(see.fetch_all("SELECT tags, props, scores, ids FROM somewhere"))
+
+    assert rows[0].tags == ["a", "b"]
+    assert rows[0].props == {"x": "1"}
+    assert rows[0].scores[0] == 1.5
+    assert math.isnan(rows[0].scores[1])
+    assert rows[0].ids == [2**64, -(2**63) - 1, 1]
+
+
+@pytest.mark.parametrize(
+    "statement,expected",
+    [
+        ("SELECT 2+2 AS id", "SELECT 2 + 2 AS id LIMIT 1"),
+        ("  select 1 AS id", "SELECT 1 AS id LIMIT 1"),
+        ("WITH a AS (SELECT 1 AS id) SELECT id FROM a", "WITH a AS (SELECT 1 AS id) SELECT id FROM a LIMIT 1"),
+        ("/* comment */ SELECT 1 AS id", "/* comment */ SELECT 1 AS id LIMIT 1"),
+        ("SHOW TABLES", "SHOW TABLES"),
+        ("DESCRIBE TABLE foo", "DESCRIBE TABLE foo"),
+        ("selection_is_not_a_keyword", "selection_is_not_a_keyword"),
+    ],
+)
+def test_add_limit(statement, expected):
+    assert StatementExecutionExt._add_limit(statement) == expected